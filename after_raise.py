@@ -9,16 +9,17 @@ For each possible feedback pattern from RAISE, we want to know:
 
 from analysis import (
     load_answers, load_all_guesses,
-    compute_feedback, feedback_to_str,
+    compute_feedback, feedback_to_digits, feedback_to_str,
     partition_by_feedback, filter_candidates,
     expected_information, expected_remaining,
     letter_frequency, positional_letter_frequency,
-    score_word_by_frequency
+    score_word_by_frequency, precompute_feedback
 )
 
 answers = load_answers()
 all_guesses = load_all_guesses()
 answer_set = set(answers)
+precompute_feedback(answers, answers)
 
 OPENER = "raise"
 
@@ -50,7 +51,7 @@ print("=" * 80)
 for fb, words in sorted_buckets[:15]:
     n_cands = len(words)
     fb_str = feedback_to_str(fb)
-    fb_codes = "".join(str(x) for x in fb)
+    fb_codes = feedback_to_digits(fb)
 
     print(f"\n--- {fb_str} ({fb_codes}) --- {n_cands} candidates ---")
 
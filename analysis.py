@@ -9,10 +9,17 @@ In hard mode, every guess must be consistent with all prior feedback, so the
 guess pool shrinks along with the candidate pool.
 """
 
+import hashlib
 import json
 import math
+import multiprocessing
+import os
 from collections import Counter
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
+from typing import Iterator, Optional
 
 
 def load_answers(path="answers.txt"):
@@ -26,54 +33,256 @@ def load_all_guesses(path="wordle_valid_guesses.json"):
 
 
 # --- Feedback computation ---
-# Encode feedback as a tuple of (0=gray, 1=yellow, 2=green) for each position.
-# This is the "pattern" that a guess produces against a target.
+# Feedback is a pattern of (0=gray, 1=yellow, 2=green) for each position,
+# packed as a base-3 number (position 0 most significant) so every pattern
+# is a single int in [0, 243). This is the "pattern" a guess produces
+# against a target, and it is what buckets and lookup tables are keyed on.
 
-def compute_feedback(guess: str, target: str) -> tuple:
+TRIT_WEIGHTS = (81, 27, 9, 3, 1)
+ALL_GREEN = 242  # (2, 2, 2, 2, 2)
+
+
+def encode_feedback(fb: tuple) -> int:
+    """Pack a feedback tuple of 5 ints into its base-3 code."""
+    return sum(x * w for x, w in zip(fb, TRIT_WEIGHTS))
+
+
+def decode_feedback(code: int) -> tuple:
+    """Unpack a base-3 feedback code into a tuple of 5 ints."""
+    return tuple(code // w % 3 for w in TRIT_WEIGHTS)
+
+
+def encode_feedback_keys(table: dict[tuple, str]) -> dict[int, str]:
+    """Convert a lookup table written with tuple keys to packed-code keys."""
+    return {encode_feedback(fb): word for fb, word in table.items()}
+
+
+def feedback_slots(table: dict[int, str]) -> list[Optional[str]]:
+    """Spread a code-keyed lookup table over a 243-slot list (None where absent).
+
+    Lookups in the hot loop become a plain list index instead of a
+    membership test plus a dict lookup.
+    """
+    slots = [None] * 243
+    for fb, word in table.items():
+        slots[fb] = word
+    return slots
+
+
+def compute_feedback(guess: str, target: str) -> int:
     """Compute Wordle feedback for a guess against a target word.
 
-    Returns a tuple of 5 ints: 0=gray, 1=yellow, 2=green.
-    Handles duplicate letters correctly per Wordle rules.
+    Returns the packed feedback code (see decode_feedback for the 5 trits).
+    Handles duplicate letters correctly per Wordle rules. Pairs covered by
+    the precomputed feedback matrix are looked up instead of computed.
     """
-    result = [0] * 5
-    target_remaining = list(target)
+    if guess == target:
+        return ALL_GREEN
+    row = _feedback_rows.get(guess)
+    if row is not None:
+        index = _answer_index.get(target)
+        if index is not None:
+            return row[index]
+
+    code = 0
+    # Target letters not matched by a green, available for yellows. Kept as
+    # a short str multiset: `in` and a single replace() are C-level and beat
+    # a 26-slot count list under CPython (no per-letter ord() or indexing).
+    unmatched = ""
+    for g, t in zip(guess, target):
+        if g != t:
+            unmatched += t
+
+    for w, g, t in zip(TRIT_WEIGHTS, guess, target):
+        if g == t:
+            code += 2 * w
+        elif g in unmatched:
+            code += w
+            unmatched = unmatched.replace(g, "", 1)  # consumed
+
+    return code
+
+
+def feedback_codes(guess: str, targets: list[str]) -> bytes:
+    """Feedback codes for one guess against each target, in order.
+
+    One byte per target; this is the batch form the partition and entropy
+    functions below are built on. Uses the precomputed feedback matrix when
+    the guess and all targets are in it.
+    """
+    row = _feedback_rows.get(guess)
+    if row is not None:
+        if targets is _matrix_answers:
+            return row
+        try:
+            return bytes(map(row.__getitem__, map(_answer_index.__getitem__, targets)))
+        except KeyError:
+            pass  # some target is not in the precomputed answer list
+    return _compute_codes(guess, targets)
+
+
+def _compute_codes(guess: str, targets: list[str]) -> bytes:
+    """Feedback codes for one guess against each target, computed directly."""
+    # A target sharing no letter with the guess is all gray (code 0); one set
+    # test settles that without walking the five positions.
+    letters = set(guess)
+    codes = bytearray(len(targets))
+    for j, target in enumerate(targets):
+        if not letters.isdisjoint(target):
+            codes[j] = compute_feedback(guess, target)
+    return bytes(codes)
+
+
+# --- Precomputed feedback matrix ---
+# The feedback of a guess against a fixed answer list never changes, so the
+# whole (guess x answer) matrix can be computed once and reused by every
+# partition/filter/entropy call. Row g holds one code byte per answer.
+
+# Part of the cache key: bump it whenever the code encoding or the file
+# layout changes, so stale cache files are ignored rather than misread.
+FEEDBACK_MATRIX_FORMAT = 1
+
+_feedback_rows: dict[str, bytes] = {}
+_answer_index: dict[str, int] = {}
+_matrix_answers: Optional[list[str]] = None
+
+
+def fork_map(fn, *iterables, workers: Optional[int] = None) -> Iterator:
+    """map(fn, *iterables), split across forked worker processes.
+
+    Results are yielded in input order. Workers are forked so they inherit
+    module state such as the precomputed feedback matrix; fn and its
+    arguments are pickled per task, so fn should read shared word lists
+    from globals rather than have them bound in (a copy misses the matrix
+    fast path). workers defaults to one per CPU; with one worker, or where
+    fork is unavailable, this is plain map in the calling process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        yield from map(fn, *iterables)
+        return
+    chunksize = max(1, len(iterables[0]) // (workers * 4))
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork")) as pool:
+        yield from pool.map(fn, *iterables, chunksize=chunksize)
+
+
+def build_feedback_matrix(guesses: list[str], answers: list[str],
+                          workers: Optional[int] = 1) -> list[bytes]:
+    """Compute the feedback code of every guess against every answer.
+
+    Rows are independent, so they are split across fork_map's workers
+    (None for one per CPU); rows stay in guess order.
+    """
+    return list(fork_map(partial(_compute_codes, targets=answers), guesses, workers=workers))
 
-    # Pass 1: find greens
-    for i in range(5):
-        if guess[i] == target[i]:
-            result[i] = 2
-            target_remaining[i] = None  # consumed
 
-    # Pass 2: find yellows
-    for i in range(5):
-        if result[i] == 2:
-            continue
-        if guess[i] in target_remaining:
-            result[i] = 1
-            target_remaining[target_remaining.index(guess[i])] = None  # consumed
+def precompute_feedback(guesses: list[str], answers: list[str], cache_dir: Optional[str] = ".",
+                        workers: Optional[int] = 1) -> None:
+    """Build (or load) the feedback matrix for guesses x answers and use it.
 
-    return tuple(result)
+    The matrix is cached in cache_dir under a name derived from the word
+    lists, so reruns with the same lists skip the build. Pass cache_dir=None
+    to keep it in memory only. A cache file of the wrong size (truncated or
+    from an interrupted write) is ignored and rebuilt, split across
+    `workers` processes (None for one per CPU).
+    """
+    global _matrix_answers
 
+    cache_path = None
+    if cache_dir is not None:
+        key = (f"v{FEEDBACK_MATRIX_FORMAT}\n" + "\n".join(guesses)
+               + "\n\n" + "\n".join(answers))
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        cache_path = os.path.join(cache_dir, f"feedback_matrix_{digest[:12]}.bin")
 
-def feedback_to_str(fb: tuple) -> str:
-    """Convert feedback tuple to emoji string for display."""
+    n = len(answers)
+    rows = None
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        if len(data) == len(guesses) * n:
+            rows = [data[i * n:(i + 1) * n] for i in range(len(guesses))]
+    if rows is None:
+        rows = build_feedback_matrix(guesses, answers, workers)
+        if cache_path:
+            # Write beside the cache and rename into place, so readers see
+            # either no file or a complete one.
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(b"".join(rows))
+            os.replace(tmp_path, cache_path)
+
+    _feedback_rows.clear()
+    _feedback_rows.update(zip(guesses, rows))
+    _answer_index.clear()
+    _answer_index.update((w, i) for i, w in enumerate(answers))
+    _matrix_answers = answers
+
+
+def feedback_to_str(fb: int) -> str:
+    """Convert a feedback code to emoji string for display."""
     symbols = {0: "⬛", 1: "🟨", 2: "🟩"}
-    return "".join(symbols[x] for x in fb)
+    return "".join(symbols[x] for x in decode_feedback(fb))
+
+
+def feedback_to_digits(fb: int) -> str:
+    """Convert a feedback code to its digit string, e.g. "00102"."""
+    return "".join(str(x) for x in decode_feedback(fb))
 
 
 # --- Information theory ---
 
-def partition_by_feedback(guess: str, candidates: list[str]) -> dict[tuple, list[str]]:
+def partition_by_feedback(guess: str, candidates: list[str]) -> dict[int, list[str]]:
     """Partition candidates by the feedback pattern they'd produce for a guess."""
+    # Codes index a 243-slot table directly; the dict only records buckets
+    # in first-seen order for the caller.
+    slots = [None] * 243
     buckets = {}
-    for target in candidates:
-        fb = compute_feedback(guess, target)
-        if fb not in buckets:
-            buckets[fb] = []
-        buckets[fb].append(target)
+    for fb, target in zip(feedback_codes(guess, candidates), candidates):
+        bucket = slots[fb]
+        if bucket is None:
+            bucket = slots[fb] = buckets[fb] = []
+        bucket.append(target)
     return buckets
 
 
+def bucket_sizes(guess: str, candidates: list[str]) -> list[int]:
+    """Sizes of the non-empty feedback buckets a guess splits candidates into."""
+    return list(Counter(feedback_codes(guess, candidates)).values())
+
+
+def bucket_sizes_all(guesses: list[str], candidates: list[str]) -> Iterator[list[int]]:
+    """bucket_sizes of each guess against the same candidates, lazily in order.
+
+    The candidates' matrix columns are looked up once, so a guess with a
+    precomputed row gathers all its codes with a single itemgetter call
+    instead of mapping every candidate through the answer index again.
+    """
+    gather = None
+    if len(candidates) > 1 and candidates is not _matrix_answers:
+        try:
+            gather = itemgetter(*map(_answer_index.__getitem__, candidates))
+        except KeyError:
+            pass  # some candidate is not in the precomputed answer list
+    for guess in guesses:
+        row = _feedback_rows.get(guess) if gather is not None else None
+        if row is not None:
+            yield list(Counter(gather(row)).values())
+        else:
+            yield bucket_sizes(guess, candidates)
+
+
+def _entropy(sizes: list[int], n: int) -> float:
+    """Shannon entropy of a partition of n candidates with the given bucket sizes."""
+    entropy = 0.0
+    for size in sizes:
+        p = size / n
+        if p > 0:
+            entropy -= p * math.log2(p)
+    return entropy
+
+
 def expected_information(guess: str, candidates: list[str]) -> float:
     """Calculate expected information gain (Shannon entropy) of a guess.
 
@@ -83,13 +292,68 @@ def expected_information(guess: str, candidates: list[str]) -> float:
     if n <= 1:
         return 0.0
 
-    buckets = partition_by_feedback(guess, candidates)
-    entropy = 0.0
-    for bucket in buckets.values():
-        p = len(bucket) / n
-        if p > 0:
-            entropy -= p * math.log2(p)
-    return entropy
+    return _entropy(bucket_sizes(guess, candidates), n)
+
+
+def most_informative_guess(guesses: list[str], candidates: list[str]) -> Optional[str]:
+    """The guess with the highest expected information (first wins ties).
+
+    A guess with k buckets scores at most log2(k), so guesses that cannot
+    beat the incumbent skip the entropy sum, and a guess that puts every
+    candidate in its own bucket has reached the maximum and ends the search.
+    """
+    n = len(candidates)
+    best_word = None
+    best_info = -1.0
+    for guess, sizes in zip(guesses, bucket_sizes_all(guesses, candidates)):
+        if len(sizes) == n:
+            return guess  # log2(n): nothing later can score higher
+        if best_word is not None and math.log2(len(sizes)) < best_info - 1e-9:
+            continue
+        info = _entropy(sizes, n)
+        if info > best_info:
+            best_info = info
+            best_word = guess
+    return best_word
+
+
+@lru_cache(maxsize=8192)
+def best_info_guess(candidates: tuple[str, ...]) -> Optional[str]:
+    """most_informative_guess of a candidate tuple against itself (hard mode).
+
+    Memoized on the tuple, since the small endgame buckets repeat across
+    games. The cache is per process: pooled games fill each worker's own.
+    """
+    return most_informative_guess(candidates, candidates)
+
+
+def _entropy_terms(n: int) -> list[float]:
+    """p*log2(p) for a bucket of each size 0..n out of n (0.0 for size 0).
+
+    _entropy subtracts exactly these values, in bucket order, so batch
+    scorers built on this table match it bit for bit.
+    """
+    return [0.0] + [size / n * math.log2(size / n) for size in range(1, n + 1)]
+
+
+def expected_information_all(guesses: list[str], candidates: list[str]) -> list[float]:
+    """expected_information of each guess against the same candidates.
+
+    With n fixed, a bucket's entropy term depends only on its size, so each
+    -p*log2(p) is computed once per size rather than once per bucket.
+    """
+    n = len(candidates)
+    if n <= 1:
+        return [0.0] * len(guesses)
+
+    terms = _entropy_terms(n)
+    infos = []
+    for sizes in bucket_sizes_all(guesses, candidates):
+        entropy = 0.0
+        for size in sizes:
+            entropy -= terms[size]
+        infos.append(entropy)
+    return infos
 
 
 def expected_remaining(guess: str, candidates: list[str]) -> float:
@@ -101,34 +365,105 @@ def expected_remaining(guess: str, candidates: list[str]) -> float:
     if n <= 1:
         return 0.0
 
-    buckets = partition_by_feedback(guess, candidates)
-    return sum(len(b) * len(b) for b in buckets.values()) / n
+    return sum(size * size for size in bucket_sizes(guess, candidates)) / n
 
 
 def worst_case_remaining(guess: str, candidates: list[str]) -> int:
     """Worst-case (largest) bucket size after guessing."""
-    buckets = partition_by_feedback(guess, candidates)
-    return max(len(b) for b in buckets.values())
+    return max(bucket_sizes(guess, candidates))
+
+
+def guess_stats(guess: str, candidates: list[str]) -> tuple[float, float, int]:
+    """(expected information, expected remaining, worst case) of a guess.
+
+    All three come from the same bucket sizes, so this partitions the
+    candidates once instead of once per measure.
+    """
+    n = len(candidates)
+    sizes = bucket_sizes(guess, candidates)
+    worst = max(sizes)
+    if n <= 1:
+        return 0.0, 0.0, worst
+    return _entropy(sizes, n), sum(size * size for size in sizes) / n, worst
+
+
+def guess_stats_all(guesses: list[str], candidates: list[str]) -> list[tuple[float, float, int]]:
+    """guess_stats of each guess against the same candidates.
+
+    Like expected_information_all, the entropy terms are tabulated once
+    per bucket size and shared by every guess.
+    """
+    n = len(candidates)
+    terms = _entropy_terms(n) if n > 1 else None
+    stats = []
+    for sizes in bucket_sizes_all(guesses, candidates):
+        worst = max(sizes)
+        if terms is None:
+            stats.append((0.0, 0.0, worst))
+            continue
+        entropy = 0.0
+        for size in sizes:
+            entropy -= terms[size]
+        stats.append((entropy, sum(size * size for size in sizes) / n, worst))
+    return stats
 
 
 # --- Letter frequency analysis ---
 
 def letter_frequency(words: list[str]) -> Counter:
     """Count letter frequency across all words (each letter counted once per word)."""
-    c = Counter()
-    for w in words:
-        for ch in set(w):  # unique letters per word
-            c[ch] += 1
-    return c
+    return Counter(chain.from_iterable(map(set, words)))  # unique letters per word
+
+
+def letter_columns(words: list[str]) -> list[str]:
+    """The letters at each position (0-4) across all words, one str per position.
+
+    A column-major view of the word list: position i of every word is
+    contiguous, so per-position scans run over a single string.
+    """
+    letters = "".join(words)
+    return [letters[i::5] for i in range(5)]
+
+
+# The bit for each lowercase letter in a letter_mask (a=1, b=2, c=4, ...).
+# A dict lookup is cheaper than 1 << (ord(ch) - 97) in CPython.
+LETTER_BITS = {chr(97 + i): 1 << i for i in range(26)}
+
+
+def letter_mask(word: str) -> int:
+    """The set of letters in a word as a 26-bit mask (duplicates collapse).
+
+    Set operations on letters become single integer ops: & for overlap,
+    & ~tested for the letters not yet tested.
+    """
+    mask = 0
+    for ch in word:
+        mask |= LETTER_BITS[ch]
+    return mask
+
+
+@lru_cache(maxsize=None)
+def word_letter_mask(word: str) -> int:
+    """letter_mask of a word, computed once per word."""
+    return letter_mask(word)
 
 
 def positional_letter_frequency(words: list[str]) -> list[Counter]:
     """Count letter frequency at each position (0-4)."""
-    pos_counts = [Counter() for _ in range(5)]
-    for w in words:
-        for i, ch in enumerate(w):
-            pos_counts[i][ch] += 1
-    return pos_counts
+    return [Counter(column) for column in letter_columns(words)]
+
+
+@lru_cache(maxsize=4096)
+def cached_positional_shares(candidates: tuple[str, ...]) -> list[dict[str, float]]:
+    """Each letter's share of the candidates at each position (0-4).
+
+    Keyed by the candidate tuple: different targets that land in the same
+    feedback bucket share the identical candidate list, so most calls in a
+    simulation are repeats.
+    """
+    n = len(candidates)
+    return [{ch: count / n for ch, count in freq.items()}
+            for freq in positional_letter_frequency(candidates)]
 
 
 # --- Scoring words ---
@@ -140,11 +475,12 @@ def score_word_by_frequency(word: str, freq: Counter, n_words: int) -> float:
     information (1 bit per letter). Score penalizes deviation from 50%.
     """
     score = 0.0
-    seen = set()
+    mask = 0  # letters already scored
     for ch in word:
-        if ch in seen:
+        bit = LETTER_BITS[ch]
+        if mask & bit:
             continue  # duplicate letters in guess are wasteful for info gathering
-        seen.add(ch)
+        mask |= bit
         p = freq[ch] / n_words
         # Information from a binary test (present/absent):
         # H = -p*log2(p) - (1-p)*log2(1-p), maximized at p=0.5
@@ -169,40 +505,55 @@ def score_word_positional(word: str, pos_freq: list[Counter], n_words: int) -> f
 
 # --- Filtering candidates (hard mode) ---
 
-def filter_candidates(candidates: list[str], guess: str, feedback: tuple) -> list[str]:
+def filter_candidates(candidates: list[str], guess: str, feedback: int) -> list[str]:
     """Filter candidates to those consistent with observed feedback.
 
     This enforces hard mode: the returned list only contains words that
     could still be the answer given the guess and its feedback.
     """
+    # Surviving words are usually a small fraction, so jump between matching
+    # code bytes with bytes.find instead of testing every candidate.
+    codes = feedback_codes(guess, candidates)
     result = []
-    for word in candidates:
-        if compute_feedback(guess, word) == feedback:
-            result.append(word)
+    i = codes.find(feedback)
+    while i != -1:
+        result.append(candidates[i])
+        i = codes.find(feedback, i + 1)
     return result
 
 
 # --- Top-level analysis ---
 
+def _matrix_guess_stats(guess: str) -> tuple[float, float, int]:
+    """guess_stats against the precomputed answer list (a pool worker task)."""
+    return guess_stats(guess, _matrix_answers)
+
+
 def rank_opening_words(answers: list[str], top_n: int = 20,
-                       guess_pool: Optional[list[str]] = None) -> list[tuple]:
+                       guess_pool: Optional[list[str]] = None,
+                       workers: Optional[int] = None) -> list[tuple]:
     """Rank words by expected information gain as opening guess.
 
     In hard mode, the guess must come from the valid guess pool but we
-    evaluate against the answer list.
+    evaluate against the answer list. Guesses are scored independently, so
+    the pool is split across fork_map's `workers` (default: one per CPU).
     """
     if guess_pool is None:
         guess_pool = answers
 
-    results = []
+    if answers is _matrix_answers:
+        # Workers read the answer list they inherited; binding it into a
+        # partial would pickle a copy per task and miss the matrix fast path.
+        score = _matrix_guess_stats
+    else:
+        score = partial(guess_stats, candidates=answers)
     total = len(guess_pool)
-    for i, word in enumerate(guess_pool):
+    stats = fork_map(score, guess_pool, workers=workers)
+    results = []
+    for i, (word, word_stats) in enumerate(zip(guess_pool, stats)):
         if (i + 1) % 500 == 0:
             print(f"  Evaluated {i+1}/{total}...")
-        info = expected_information(word, answers)
-        exp_rem = expected_remaining(word, answers)
-        worst = worst_case_remaining(word, answers)
-        results.append((word, info, exp_rem, worst))
+        results.append((word, *word_stats))
 
     results.sort(key=lambda x: -x[1])  # sort by info descending
     return results[:top_n]
@@ -210,6 +561,7 @@ def rank_opening_words(answers: list[str], top_n: int = 20,
 
 if __name__ == "__main__":
     answers = load_answers()
+    precompute_feedback(answers, answers)
     n = len(answers)
     print(f"Answer list: {n} words")
     print(f"Theoretical minimum info needed: {math.log2(n):.2f} bits")
@@ -2,6 +2,8 @@
 """Find all three-consonant sequences in the Wordle word list and rank by frequency."""
 
 import json
+from collections import Counter
+from itertools import chain
 
 VOWELS = set("aeiou")
 WORD_LIST = "wordle_valid_guesses.json"
@@ -12,26 +14,34 @@ def is_consonant(ch):
     return ch.isalpha() and ch not in VOWELS
 
 
+# 1 for each ASCII consonant byte, else 0.
+IS_CONSONANT = bytes(is_consonant(chr(b)) for b in range(128))
+
+
 def find_three_consonant_sequences(word):
     """Yield every 3-letter consonant substring found in *word*."""
-    seq = []
-    for ch in word:
-        if is_consonant(ch):
-            seq.append(ch)
-            if len(seq) >= 3:
-                yield "".join(seq[-3:])
+    # Byte i of an ASCII word is its character i, so the byte table lines up
+    # with the str slices; any other word is classified character by character.
+    if word.isascii():
+        flags = map(IS_CONSONANT.__getitem__, word.encode())
+    else:
+        flags = map(is_consonant, word)
+    run = 0  # length of the consonant run ending at i
+    for i, consonant in enumerate(flags):
+        if consonant:
+            run += 1
+            if run >= 3:
+                yield word[i - 2:i + 1]
         else:
-            seq = []
+            run = 0
 
 
 def main():
     with open(WORD_LIST) as f:
         words = json.load(f)
 
-    counts: dict[str, int] = {}
-    for word in words:
-        for seq in find_three_consonant_sequences(word.lower()):
-            counts[seq] = counts.get(seq, 0) + 1
+    counts = Counter(chain.from_iterable(
+        find_three_consonant_sequences(word.lower()) for word in words))
 
     ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
 
@@ -16,6 +16,11 @@ HEADERS = {
     )
 }
 
+# JS array literals that contain only 5-letter lowercase words, and the
+# words inside one.
+WORD_ARRAY_PATTERN = re.compile(r'\[("(?:[a-z]{5})",?\s*){20,}\]')
+WORD_PATTERN = re.compile(r'"([a-z]{5})"')
+
 
 class ScriptSrcParser(HTMLParser):
     """Extract src attributes from <script> tags."""
@@ -43,13 +48,10 @@ def find_word_arrays(js_text):
     Search for arrays of 5-letter lowercase words in the JS bundle.
     Returns a list of unique word-list candidates, largest first.
     """
-    # Match JS array literals that contain only 5-letter lowercase words
-    pattern = re.compile(r'\[("(?:[a-z]{5})",?\s*){20,}\]')
-    candidates = []
-    for match in pattern.finditer(js_text):
-        words = re.findall(r'"([a-z]{5})"', match.group())
-        if len(words) >= 20:
-            candidates.append(words)
+    # The array pattern guarantees 20+ words per match; pull them out of the
+    # matched span in place rather than copying it out first.
+    candidates = [WORD_PATTERN.findall(js_text, *match.span())
+                  for match in WORD_ARRAY_PATTERN.finditer(js_text)]
     # Deduplicate and sort largest first
     seen = set()
     unique = []
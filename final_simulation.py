@@ -7,52 +7,48 @@ Tests a few variants of the lookup table to find the best combination.
 import time
 from collections import Counter
 from analysis import (
-    load_answers, load_all_guesses,
-    compute_feedback, feedback_to_str,
+    load_answers,
+    ALL_GREEN, compute_feedback, encode_feedback_keys, feedback_slots, feedback_to_str,
     partition_by_feedback, filter_candidates,
-    expected_information, expected_remaining,
-    letter_frequency, positional_letter_frequency,
+    expected_remaining, best_info_guess,
+    letter_frequency, cached_positional_shares, precompute_feedback,
+    LETTER_BITS, letter_mask, word_letter_mask,
 )
 
 
 answers = load_answers()
-all_guesses = load_all_guesses()
-answer_set = set(answers)
+precompute_feedback(answers, answers)
 
+# Turn 1 is always RAISE, so its filter step is the same partition for
+# every game; compute it once.
+opener_buckets = partition_by_feedback("raise", answers)
 
-def improved_guess(candidates, tested_letters):
+PRIORITY = "earotilsnucyhdpgmbfkwvxzqj"
+
+
+def improved_guess(candidates, tested_mask):
     if len(candidates) <= 2:
         return candidates[0]
     if len(candidates) <= 20:
-        best_word = None
-        best_info = -1
-        for word in candidates:
-            info = expected_information(word, candidates)
-            if info > best_info:
-                best_info = info
-                best_word = word
-        return best_word
-
-    PRIORITY = list("earotilsnucyhdpgmbfkwvxzqj")
-    untested = [ch for ch in PRIORITY if ch not in tested_letters]
-    pos_freq = positional_letter_frequency(candidates)
-    n = len(candidates)
+        return best_info_guess(tuple(candidates))
+
+    # Score for each untested letter: its rank counted from the back of the
+    # untested priority list, keyed by the letter's mask bit.
+    untested = [ch for ch in PRIORITY if not tested_mask & LETTER_BITS[ch]]
+    untested_rank = {LETTER_BITS[ch]: len(untested) - idx for idx, ch in enumerate(untested)}
+    untested_mask = sum(untested_rank)
+    pos_shares = cached_positional_shares(tuple(candidates))
     best_word = None
     best_score = -1.0
     for word in candidates:
+        # Each untested letter of the word once, lowest bit first.
         untested_score = 0
-        seen = set()
-        for ch in word:
-            if ch in seen:
-                continue
-            seen.add(ch)
-            if ch not in tested_letters:
-                try:
-                    idx = untested.index(ch)
-                    untested_score += (len(untested) - idx)
-                except ValueError:
-                    pass
-        pos_score = sum(pos_freq[i].get(ch, 0) / n for i, ch in enumerate(word))
+        new_letters = word_letter_mask(word) & untested_mask
+        while new_letters:
+            bit = new_letters & -new_letters
+            untested_score += untested_rank[bit]
+            new_letters ^= bit
+        pos_score = sum(pos_shares[i].get(ch, 0) for i, ch in enumerate(word))
         score = untested_score * 100 + pos_score
         if score > best_score:
             best_score = score
@@ -63,37 +59,37 @@ def improved_guess(candidates, tested_letters):
 def simulate(table, label, verbose_failures=True):
     results = []
     failures = []
+    guess2_slots = feedback_slots(table)
     start = time.time()
 
     for target in answers:
-        candidates = list(answers)
         guesses_list = []
-        tested = set()
+        tested = 0  # letter_mask of every letter guessed so far
         solved = False
 
         for turn in range(1, 7):
             if turn == 1:
                 guess = "raise"
             elif turn == 2:
-                prev_fb = guesses_list[-1][1]
-                if prev_fb in table:
-                    guess = table[prev_fb]
-                else:
+                guess = guess2_slots[guesses_list[-1][1]]
+                if guess is None:
                     guess = improved_guess(candidates, tested)
             else:
                 guess = improved_guess(candidates, tested)
 
             fb = compute_feedback(guess, target)
             guesses_list.append((guess, fb))
-            for ch in guess:
-                tested.add(ch)
+            tested |= letter_mask(guess)
 
-            if fb == (2, 2, 2, 2, 2):
+            if fb == ALL_GREEN:
                 results.append(turn)
                 solved = True
                 break
 
-            candidates = filter_candidates(candidates, guess, fb)
+            if turn == 1:
+                candidates = opener_buckets[fb]
+            else:
+                candidates = filter_candidates(candidates, guess, fb)
 
         if not solved:
             results.append(6)
@@ -120,7 +116,7 @@ def simulate(table, label, verbose_failures=True):
 # Test several variants
 
 # Variant A: Original (CLOUT, TOWEL, OUTER)
-table_a = {
+table_a = encode_feedback_keys({
     (0,0,0,0,0): "clout",
     (0,0,0,0,1): "towel",
     (0,0,1,0,0): "pilot",
@@ -133,10 +129,10 @@ table_a = {
     (0,1,0,0,1): "cleat",
     (0,0,0,0,2): "lunge",
     (0,0,2,0,0): "glint",
-}
+})
 
 # Variant B: Better info words (CLOTH, OLDEN, DETER)
-table_b = {
+table_b = encode_feedback_keys({
     (0,0,0,0,0): "cloth",
     (0,0,0,0,1): "olden",
     (0,0,1,0,0): "pilot",
@@ -149,10 +145,10 @@ table_b = {
     (0,1,0,0,1): "cleat",
     (0,0,0,0,2): "lunge",
     (0,0,2,0,0): "glint",
-}
+})
 
 # Variant C: Near-optimal info words (MULCH, OLDEN, DETER, STUNK)
-table_c = {
+table_c = encode_feedback_keys({
     (0,0,0,0,0): "mulch",
     (0,0,0,0,1): "olden",
     (0,0,1,0,0): "pilot",
@@ -165,10 +161,10 @@ table_c = {
     (0,1,0,0,1): "cleat",
     (0,0,0,0,2): "lunge",
     (0,0,2,0,0): "glint",
-}
+})
 
 # Variant D: Mixed - best info where words are still memorable
-table_d = {
+table_d = encode_feedback_keys({
     (0,0,0,0,0): "cloth",     # 5.162 - very common, tests C,L,O,T,H
     (0,0,0,0,1): "olden",     # 4.946 - common, tests O,L,D,N + E
     (0,0,1,0,0): "pilot",     # 4.693 - optimal & common
@@ -181,7 +177,7 @@ table_d = {
     (0,1,0,0,1): "cleat",     # 4.637 - optimal & common
     (0,0,0,0,2): "lunge",     # 4.230 - optimal & common
     (0,0,2,0,0): "glint",     # 4.145 - optimal & common
-}
+})
 
 
 print("=" * 70)
@@ -11,18 +11,19 @@ Then simulate the complete strategy.
 """
 
 import time
-from collections import Counter
 from analysis import (
-    load_answers, load_all_guesses,
-    compute_feedback, feedback_to_str,
+    load_answers,
+    ALL_GREEN, compute_feedback, decode_feedback, encode_feedback_keys, feedback_slots,
+    feedback_to_digits, feedback_to_str,
     partition_by_feedback, filter_candidates,
-    expected_information, expected_remaining,
-    letter_frequency, positional_letter_frequency,
+    expected_information, expected_information_all, expected_remaining,
+    best_info_guess,
+    letter_frequency, cached_positional_shares, LETTER_BITS, letter_mask, word_letter_mask,
+    precompute_feedback, fork_map,
 )
 
 answers = load_answers()
-all_guesses = load_all_guesses()
-answer_set = set(answers)
+precompute_feedback(answers, answers)
 OPENER = "raise"
 
 # The top 15 feedback patterns from RAISE by bucket size
@@ -35,27 +36,25 @@ print("TOP SECOND GUESSES PER PATTERN (for human selection)\n")
 print("Looking for common, memorable words close to optimal...\n")
 
 human_friendly_overrides = {}
+optimal_info = {}  # pattern -> best info among its bucket, reused below
 
 for fb in sorted_patterns[:15]:
     cands = buckets[fb]
     fb_str = feedback_to_str(fb)
-    codes = "".join(str(x) for x in fb)
+    codes = feedback_to_digits(fb)
     n = len(cands)
 
-    # Compute info for all candidates
-    scored = []
-    for word in cands:
-        info = expected_information(word, cands)
-        exp_rem = expected_remaining(word, cands)
-        scored.append((word, info, exp_rem))
+    # Compute info for all candidates; E[rem] only for the 10 printed below
+    scored = list(zip(cands, expected_information_all(cands, cands)))
     scored.sort(key=lambda x: -x[1])
 
-    best_info = scored[0][1]
+    best_info = optimal_info[fb] = scored[0][1]
 
     # Describe the pattern in human terms
-    greens = [OPENER[i] for i in range(5) if fb[i] == 2]
-    yellows = [OPENER[i] for i in range(5) if fb[i] == 1]
-    grays = [OPENER[i] for i in range(5) if fb[i] == 0]
+    trits = decode_feedback(fb)
+    greens = [OPENER[i] for i in range(5) if trits[i] == 2]
+    yellows = [OPENER[i] for i in range(5) if trits[i] == 1]
+    grays = [OPENER[i] for i in range(5) if trits[i] == 0]
     desc = ""
     if greens:
         desc += f"Green: {','.join(greens)}  "
@@ -66,7 +65,8 @@ for fb in sorted_patterns[:15]:
     print(f"--- {fb_str} ({codes}) [{n} words] ---")
     print(f"  {desc}")
     print(f"  Top 10 words (info / E[rem] / gap from optimal):")
-    for word, info, exp_rem in scored[:10]:
+    for word, info in scored[:10]:
+        exp_rem = expected_remaining(word, cands)
         gap = best_info - info
         print(f"    {word:<10} info={info:.3f}  E[rem]={exp_rem:.1f}  gap={gap:.3f}")
     print()
@@ -78,7 +78,7 @@ print("=" * 70)
 
 # For each pattern, I'll pick the best word that's common and memorable
 # Criteria: prefer answer words, prefer common English, acceptable info loss < 0.1 bits
-lookup_table = {
+lookup_table = encode_feedback_keys({
     # All gray: MULCH, CLOTH, CLOUT are all good
     (0,0,0,0,0): "clout",    # C,L,O,U,T - top 5 untested letters!
     # Only E yellow (pos 5): BETEL is obscure, OLDEN/TOWEL/HOTEL are better
@@ -103,15 +103,17 @@ lookup_table = {
     (0,0,0,0,2): "lunge",
     # I green (pos 3): GLINT is good
     (0,0,2,0,0): "glint",
-}
+})
 
 for fb, word in lookup_table.items():
     cands = buckets[fb]
     info = expected_information(word, cands)
     exp_rem = expected_remaining(word, cands)
 
-    # Find the optimal for comparison
-    best_info = max(expected_information(w, cands) for w in cands)
+    # Find the optimal for comparison (already known for the top patterns)
+    best_info = optimal_info.get(fb)
+    if best_info is None:
+        best_info = max(expected_information(w, cands) for w in cands)
 
     fb_str = feedback_to_str(fb)
     gap = best_info - info
@@ -125,50 +127,35 @@ print("SIMULATION: Human-friendly lookup table + improved heuristic")
 print(f"{'='*70}")
 
 
-def improved_guess(candidates, tested_letters):
+PRIORITY = "earotilsnucyhdpgmbfkwvxzqj"
+
+
+def improved_guess(candidates, tested_mask):
     if len(candidates) <= 2:
         return candidates[0]
 
-    # Check for single-position ambiguity
-    varying = {}
-    for pos in range(5):
-        letters = set(w[pos] for w in candidates)
-        if len(letters) > 1:
-            varying[pos] = letters
-
     # Small candidate pool: use info-theoretic
     if len(candidates) <= 20:
-        best_word = None
-        best_info = -1
-        for word in candidates:
-            info = expected_information(word, candidates)
-            if info > best_info:
-                best_info = info
-                best_word = word
-        return best_word
-
-    # Large pool: letter priority
-    PRIORITY = list("earotilsnucyhdpgmbfkwvxzqj")
-    untested = [ch for ch in PRIORITY if ch not in tested_letters]
-    pos_freq = positional_letter_frequency(candidates)
-    n = len(candidates)
+        return best_info_guess(tuple(candidates))
+
+    # Large pool: letter priority. Each untested letter scores its rank
+    # counted from the back of the untested priority list, keyed by mask bit.
+    untested = [ch for ch in PRIORITY if not tested_mask & LETTER_BITS[ch]]
+    untested_rank = {LETTER_BITS[ch]: len(untested) - idx for idx, ch in enumerate(untested)}
+    untested_mask = sum(untested_rank)
+    pos_shares = cached_positional_shares(tuple(candidates))
 
     best_word = None
     best_score = -1.0
     for word in candidates:
+        # Each untested letter of the word once, lowest bit first.
         untested_score = 0
-        seen = set()
-        for ch in word:
-            if ch in seen:
-                continue
-            seen.add(ch)
-            if ch not in tested_letters:
-                try:
-                    idx = untested.index(ch)
-                    untested_score += (len(untested) - idx)
-                except ValueError:
-                    pass
-        pos_score = sum(pos_freq[i].get(ch, 0) / n for i, ch in enumerate(word))
+        new_letters = word_letter_mask(word) & untested_mask
+        while new_letters:
+            bit = new_letters & -new_letters
+            untested_score += untested_rank[bit]
+            new_letters ^= bit
+        pos_score = sum(pos_shares[i].get(ch, 0) for i, ch in enumerate(word))
         score = untested_score * 100 + pos_score
         if score > best_score:
             best_score = score
@@ -176,58 +163,76 @@ def improved_guess(candidates, tested_letters):
     return best_word
 
 
-results = []
-failures = []
-guess2_hits = 0
-guess2_misses = 0
-start = time.time()
+def play_game(target):
+    """Play one game against target.
 
-for target in answers:
-    candidates = list(answers)
+    Returns (turns used, [(guess, feedback), ...], solved, lookup hit), where
+    lookup hit is None if the game ended before turn 2.
+    """
     guesses_list = []
-    tested = set()
-    solved = False
+    tested = 0  # letter_mask of every letter guessed so far
+    lookup_hit = None
 
     for turn in range(1, 7):
         if turn == 1:
             guess = OPENER
         elif turn == 2:
-            prev_fb = guesses_list[-1][1]
-            if prev_fb in lookup_table:
-                guess = lookup_table[prev_fb]
-                guess2_hits += 1
-            else:
+            guess = guess2_slots[guesses_list[-1][1]]
+            lookup_hit = guess is not None
+            if guess is None:
                 guess = improved_guess(candidates, tested)
-                guess2_misses += 1
         else:
             guess = improved_guess(candidates, tested)
 
         fb = compute_feedback(guess, target)
         guesses_list.append((guess, fb))
-        for ch in guess:
-            tested.add(ch)
+        tested |= letter_mask(guess)
 
-        if fb == (2, 2, 2, 2, 2):
-            results.append(turn)
-            solved = True
-            break
+        if fb == ALL_GREEN:
+            return turn, guesses_list, True, lookup_hit
 
-        candidates = filter_candidates(candidates, guess, fb)
+        # Turn 1 is always OPENER, whose partition of the answers is buckets.
+        if turn == 1:
+            candidates = buckets[fb]
+        else:
+            candidates = filter_candidates(candidates, guess, fb)
+
+    return 6, guesses_list, False, lookup_hit
+
+
+guess_counts = [0] * 7  # games solved (or given up) at each turn 1-6
+failures = []
+guess2_hits = 0
+guess2_misses = 0
+guess2_slots = feedback_slots(lookup_table)
 
+# Games are independent, so targets are split across one process per CPU.
+# fork_map only forks, so the workers inherit the tables, and this script
+# needs no __main__ guard for spawn to re-import.
+start = time.time()
+
+games = fork_map(play_game, answers)
+for target, (turns, guesses_list, solved, lookup_hit) in zip(answers, games):
+    guess_counts[turns] += 1
     if not solved:
-        results.append(6)
         failures.append((target, guesses_list))
+    if lookup_hit is not None:
+        if lookup_hit:
+            guess2_hits += 1
+        else:
+            guess2_misses += 1
 
 elapsed = time.time() - start
-counter = Counter(results)
 
 print(f"\nSolved: {len(answers)-len(failures)}/{len(answers)} ({(1-len(failures)/len(answers))*100:.1f}%)")
-print(f"Average guesses: {sum(results)/len(results):.4f}")
+print(f"Average guesses: {sum(k * c for k, c in enumerate(guess_counts))/len(answers):.4f}")
 print(f"Lookup table hits: {guess2_hits} ({guess2_hits/(guess2_hits+guess2_misses)*100:.0f}%)")
 print(f"Distribution:")
-for k in sorted(counter.keys()):
-    bar = "█" * (counter[k] // 5)
-    print(f"  {k} guesses: {counter[k]:4d} ({counter[k]/len(answers)*100:5.1f}%) {bar}")
+for k, count in enumerate(guess_counts):
+    if not count:
+        continue
+    bar = "█" * (count // 5)
+    print(f"  {k} guesses: {count:4d} ({count/len(answers)*100:5.1f}%) {bar}")
 print(f"Time: {elapsed:.1f}s")
 
 if failures:
@@ -10,8 +10,8 @@ waste information on the opening guess.
 """
 
 from analysis import (
-    load_answers, load_all_guesses,
-    expected_information, expected_remaining, worst_case_remaining
+    load_answers, load_all_guesses, precompute_feedback, fork_map,
+    expected_information_all, expected_remaining, worst_case_remaining
 )
 
 answers = load_answers()
@@ -25,15 +25,31 @@ print(f"Full guess pool: {len(all_guesses)} words")
 distinct_guesses = [w for w in all_guesses if len(set(w)) == 5]
 print(f"Guesses with 5 distinct letters: {len(distinct_guesses)}")
 
-# Evaluate all of them
+# Every guess is scored against the same answers; build (or load the cached)
+# feedback matrix once, one process per CPU, so reruns skip the feedback
+# computation entirely.
+precompute_feedback(distinct_guesses, answers, workers=None)
+
+
+def score_block(block):
+    """Expected information of each guess in block against the answers.
+
+    Reads the module-level answers the forked workers inherited, so the
+    matrix fast path sees the same list object.
+    """
+    return expected_information_all(block, answers)
+
+
+# Evaluate all of them, in blocks of 1000
 print("\nEvaluating all distinct-letter guesses... (this will take a while)")
-results = []
 total = len(distinct_guesses)
-for i, word in enumerate(distinct_guesses):
-    if (i + 1) % 1000 == 0:
-        print(f"  {i+1}/{total}...")
-    info = expected_information(word, answers)
-    results.append((word, info))
+blocks = [distinct_guesses[start:start + 1000] for start in range(0, total, 1000)]
+infos = []
+for i, block in enumerate(fork_map(score_block, blocks)):
+    if i:
+        print(f"  {i * 1000}/{total}...")
+    infos.extend(block)
+results = list(zip(distinct_guesses, infos))
 
 results.sort(key=lambda x: -x[1])
 
@@ -6,6 +6,9 @@ text description like "yellow e" or "yellow a green e", listing only
 the non-gray letters from the RAISE feedback pattern.
 """
 
+import hashlib
+import os
+
 import genanki
 
 # Color constants (matching generate_anki_deck.py)
@@ -154,9 +157,25 @@ entries = [
 ]
 
 
+COLOR_NAMES = {GREEN: "green", YELLOW: "yellow", GRAY: "gray"}
+
+
 def color_name(hex_color):
     """Map hex color to its display name."""
-    return {GREEN: "green", YELLOW: "yellow", GRAY: "gray"}[hex_color]
+    return COLOR_NAMES[hex_color]
+
+
+def non_gray_letters(colors):
+    """Group the non-gray letters of WORD by color, in first-seen color order.
+
+    Shared by the text preview and the card front, which describe the
+    same grouping two ways.
+    """
+    color_letters = {}
+    for letter, color in zip(WORD, colors):
+        if color != GRAY:
+            color_letters.setdefault(color, []).append(letter.lower())
+    return color_letters
 
 
 def pattern_text(colors):
@@ -168,12 +187,7 @@ def pattern_text(colors):
         R and E yellow    -> "yellow r, e"
         A yellow, E green -> "yellow a  green e"
     """
-    color_letters = {}
-    for letter, color in zip(WORD, colors):
-        if color != GRAY:
-            if color not in color_letters:
-                color_letters[color] = []
-            color_letters[color].append(letter.lower())
+    color_letters = non_gray_letters(colors)
     if not color_letters:
         return "all gray"
     parts = []
@@ -189,12 +203,7 @@ def colored_span(text, hex_color):
 
 def make_front(colors):
     """Build the front HTML: color-letter pattern as styled text."""
-    color_letters = {}
-    for letter, color in zip(WORD, colors):
-        if color != GRAY:
-            if color not in color_letters:
-                color_letters[color] = []
-            color_letters[color].append(letter.lower())
+    color_letters = non_gray_letters(colors)
     if not color_letters:
         description = "all gray"
     else:
@@ -240,15 +249,31 @@ model = genanki.Model(
 
 deck = genanki.Deck(2059400111, "Wordle – RAISE Color Patterns")
 
-for colors, answer in entries:
-    front = make_front(colors)
-    back = make_back(answer)
-    note = genanki.Note(model=model, fields=[front, back])
-    deck.add_note(note)
-
 output_path = "wordle_raise_color_patterns.apkg"
-genanki.Package(deck).write_to_file(output_path)
-print(f"Created {output_path} with {len(entries)} cards.")
+
+# The deck is fully determined by this script (entries, HTML, IDs), so skip
+# the genanki build when the script is unchanged since the last write.
+with open(__file__, "rb") as f:
+    digest = hashlib.sha1(f.read()).hexdigest()
+digest_path = output_path + ".sha1"
+up_to_date = False
+if os.path.exists(output_path) and os.path.exists(digest_path):
+    with open(digest_path) as f:
+        up_to_date = f.read().strip() == digest
+
+if up_to_date:
+    print(f"{output_path} is up to date ({len(entries)} cards).")
+else:
+    for colors, answer in entries:
+        front = make_front(colors)
+        back = make_back(answer)
+        note = genanki.Note(model=model, fields=[front, back])
+        deck.add_note(note)
+
+    genanki.Package(deck).write_to_file(output_path)
+    with open(digest_path, "w") as f:
+        f.write(digest + "\n")
+    print(f"Created {output_path} with {len(entries)} cards.")
 print()
 print("Card previews:")
 for colors, answer in entries:
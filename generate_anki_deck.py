@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Generate an Anki deck for the Wordle RAISE lookup table."""
 
+from functools import lru_cache
+
 import genanki
 
 # Colors matching Wordle tiles
@@ -8,6 +10,7 @@ GREEN = "#6aaa64"
 YELLOW = "#c9b458"
 GRAY = "#787c7e"
 
+@lru_cache(maxsize=None)
 def tile_html(letter, color):
     """Render a single Wordle tile as HTML."""
     return (
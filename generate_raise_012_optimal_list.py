@@ -4,13 +4,13 @@ patterns with 0, 1, or 2 total non-gray tiles (green + yellow).
 """
 
 import argparse
-from collections import Counter, defaultdict
 
 from analysis import (
-    expected_information,
-    expected_remaining,
+    decode_feedback,
+    feedback_to_digits,
     feedback_to_str,
-    filter_candidates,
+    fork_map,
+    guess_stats_all,
     load_all_guesses,
     load_answers,
     partition_by_feedback,
@@ -23,39 +23,25 @@ TARGET_HIT_COUNTS = {0, 1, 2}
 
 def best_second_guess(candidates, valid_guesses):
     """Pick the guess minimizing expected remaining candidates."""
-    best_word = None
-    best_exp_rem = float("inf")
-    best_info = -1.0
-    best_is_candidate = False
     candidate_set = set(candidates)
 
-    for guess in valid_guesses:
-        exp_rem = expected_remaining(guess, candidates)
-        info = expected_information(guess, candidates)
-        is_candidate = guess in candidate_set
-
-        if exp_rem < best_exp_rem:
-            best_word = guess
-            best_exp_rem = exp_rem
-            best_info = info
-            best_is_candidate = is_candidate
-            continue
-
-        if exp_rem == best_exp_rem:
-            if info > best_info:
-                best_word = guess
-                best_info = info
-                best_is_candidate = is_candidate
-                continue
-            if info == best_info:
-                if is_candidate and not best_is_candidate:
-                    best_word = guess
-                    best_is_candidate = True
-                    continue
-                if is_candidate == best_is_candidate and guess < best_word:
-                    best_word = guess
-
-    return best_word, best_exp_rem, best_info
+    # All guesses are scored against the same candidates in one batch;
+    # each partition yields both measures (the worst case is unused).
+    # Ties on E[rem] go to higher info, then to a guess that is itself a
+    # candidate, then alphabetically, so one key tuple orders everything.
+    scored = zip(valid_guesses, guess_stats_all(valid_guesses, candidates))
+    best = min(
+        (
+            (exp_rem, -info, guess not in candidate_set, guess)
+            for guess, (info, exp_rem, _) in scored
+        ),
+        default=None,
+    )
+    if best is None:
+        return None, float("inf"), -1.0
+
+    best_exp_rem, neg_info, _, best_word = best
+    return best_word, best_exp_rem, -neg_info
 
 
 def main():
@@ -72,11 +58,14 @@ def main():
     all_guesses = load_all_guesses()
     buckets = partition_by_feedback(OPENER, answers)
     guess_pool = all_guesses if args.guess_pool == "all" else answers
+    # Hard mode: the valid second guesses for a pattern are the pool words
+    # that give that same feedback against the opener. Split the pool once.
+    guess_buckets = partition_by_feedback(OPENER, guess_pool)
 
     target_patterns = [
         fb
         for fb in buckets
-        if sum(fb) in TARGET_HIT_COUNTS and len(buckets[fb]) > 1
+        if sum(decode_feedback(fb)) in TARGET_HIT_COUNTS and len(buckets[fb]) > 1
     ]
     target_patterns.sort(key=lambda fb: (-len(buckets[fb]), fb))
 
@@ -86,15 +75,19 @@ def main():
     )
     print()
 
+    # Patterns are independent, so their scans are split across one process
+    # per CPU; results come back in pattern order for the progress lines.
+    pattern_candidates = [buckets[fb] for fb in target_patterns]
+    pattern_guesses = [guess_buckets.get(fb, []) for fb in target_patterns]
+    bests = fork_map(best_second_guess, pattern_candidates, pattern_guesses)
     results = []
-    for i, fb in enumerate(target_patterns, start=1):
-        candidates = buckets[fb]
-        valid_guesses = filter_candidates(guess_pool, OPENER, fb)
-        best_word, exp_rem, info = best_second_guess(candidates, valid_guesses)
+    for i, (fb, candidates, (best_word, exp_rem, info)) in enumerate(
+        zip(target_patterns, pattern_candidates, bests), start=1
+    ):
         results.append((fb, len(candidates), best_word, exp_rem, info))
         print(
             f"[{i:02d}/{len(target_patterns)}] {feedback_to_str(fb)} "
-            f"({''.join(str(x) for x in fb)}) "
+            f"({feedback_to_digits(fb)}) "
             f"cands={len(candidates):>3} -> {best_word}"
         )
 
@@ -107,18 +100,20 @@ def main():
     print("-" * 52)
     for fb, n_cands, word, exp_rem, info in results:
         print(
-            f"{feedback_to_str(fb):<8} {''.join(str(x) for x in fb):<6} {n_cands:>6} "
+            f"{feedback_to_str(fb):<8} {feedback_to_digits(fb):<6} {n_cands:>6} "
             f"{word:<8} {exp_rem:>7.2f} {info:>7.3f}"
         )
 
-    usage = Counter(word for _, _, word, _, _ in results)
-    covered_words = defaultdict(int)
+    # Pattern count and answer coverage per word, gathered in one pass.
+    usage = {}
+    covered_words = {}
     for _, n_cands, word, _, _ in results:
-        covered_words[word] += n_cands
+        usage[word] = usage.get(word, 0) + 1
+        covered_words[word] = covered_words.get(word, 0) + n_cands
 
     print()
     print("Optimal word list (deduplicated):")
-    for word, count in usage.most_common():
+    for word, count in sorted(usage.items(), key=lambda item: item[1], reverse=True):
         print(f"  {word}: used by {count:>2} patterns, covers {covered_words[word]:>3} answers")
 
 
@@ -11,10 +11,12 @@ Also: find optimal second-word lookup table for common RAISE feedback categories
 from collections import Counter, defaultdict
 from analysis import (
     load_answers, load_all_guesses,
-    compute_feedback, feedback_to_str,
+    ALL_GREEN, compute_feedback, feedback_to_str,
     partition_by_feedback, filter_candidates,
     expected_information, expected_remaining,
-    letter_frequency, positional_letter_frequency
+    LETTER_BITS, letter_columns, letter_frequency, letter_mask, word_letter_mask,
+    cached_positional_shares,
+    precompute_feedback, fork_map,
 )
 
 
@@ -25,8 +27,8 @@ def find_varying_positions(candidates):
     Only includes positions where more than one letter appears.
     """
     varying = {}
-    for pos in range(5):
-        letters = set(w[pos] for w in candidates)
+    for pos, column in enumerate(letter_columns(candidates)):
+        letters = set(column)
         if len(letters) > 1:
             varying[pos] = letters
     return varying
@@ -59,27 +61,20 @@ def find_discriminator(candidates, all_valid_guesses, target_pos, target_letters
     Strategy: pick a word containing the maximum number of letters from
     target_letters, ideally in positions where they're most common.
     """
-    candidate_set = set(candidates)
-    best_word = None
-    best_coverage = 0
-    best_is_candidate = False
+    target_mask = letter_mask(target_letters)
 
-    for word in candidates:
-        # Count how many target letters appear in this word
-        coverage = len(target_letters & set(word))
-        is_cand = word in candidate_set
-        if coverage > best_coverage or (coverage == best_coverage and is_cand and not best_is_candidate):
-            best_coverage = coverage
-            best_word = word
-            best_is_candidate = is_cand
+    def coverage(word):
+        # Count how many target letters appear in this word (bits in common)
+        return bin(target_mask & word_letter_mask(word)).count("1")
 
-    return best_word
+    # Every word scored is a candidate, so the first best coverage wins
+    return max(candidates, key=coverage)
 
 
 LETTER_PRIORITY = list("earotilsnucyhdpgmbfkwvxzqj")
 
 
-def improved_human_guess(candidates, all_guesses, tested_letters):
+def improved_human_guess(candidates, all_guesses, tested_mask):
     """
     Improved human heuristic:
     1. If <=2 candidates, guess first one
@@ -98,49 +93,38 @@ def improved_human_guess(candidates, all_guesses, tested_letters):
             return disc
 
     # Standard heuristic: maximize untested high-priority letters
-    untested_priority = [ch for ch in LETTER_PRIORITY if ch not in tested_letters]
-    pos_freq = positional_letter_frequency(candidates)
-    n = len(candidates)
-
-    best_word = None
-    best_score = -1
-
-    for word in candidates:
+    untested_priority = [ch for ch in LETTER_PRIORITY if not tested_mask & LETTER_BITS[ch]]
+    untested_rank = {LETTER_BITS[ch]: len(untested_priority) - idx
+                     for idx, ch in enumerate(untested_priority)}
+    untested_mask = sum(untested_rank)
+    pos_shares = cached_positional_shares(tuple(candidates))
+
+    def score(word):
+        # Distinct untested letters of the word, one mask bit each
         untested_score = 0
-        seen = set()
-        for ch in word:
-            if ch in seen:
-                continue
-            seen.add(ch)
-            if ch in tested_letters:
-                continue
-            try:
-                idx = untested_priority.index(ch)
-                untested_score += (len(untested_priority) - idx)
-            except ValueError:
-                pass
-
-        pos_score = sum(pos_freq[i].get(ch, 0) / n for i, ch in enumerate(word))
-        score = untested_score * 100 + pos_score
+        new_letters = word_letter_mask(word) & untested_mask
+        while new_letters:
+            bit = new_letters & -new_letters
+            untested_score += untested_rank[bit]
+            new_letters ^= bit
 
-        if score > best_score:
-            best_score = score
-            best_word = word
+        pos_score = sum(share[ch] for share, ch in zip(pos_shares, word))
+        return untested_score * 100 + pos_score
 
-    return best_word
+    return max(candidates, key=score)  # first best word wins ties
 
 
 def play_game_improved(target, all_answers, all_guesses, opener="raise", max_guesses=6, verbose=False):
     """Play a game using the improved human heuristic."""
-    candidates = list(all_answers)
+    candidates = all_answers  # never mutated; filtering builds new lists
     guesses = []
-    tested_letters = set()
+    tested_mask = 0  # letter_mask of every letter guessed so far
 
     for turn in range(1, max_guesses + 1):
         if turn == 1:
             guess = opener
         else:
-            guess = improved_human_guess(candidates, all_guesses, tested_letters)
+            guess = improved_human_guess(candidates, all_guesses, tested_mask)
 
         feedback = compute_feedback(guess, target)
         guesses.append((guess, feedback))
@@ -148,10 +132,9 @@ def play_game_improved(target, all_answers, all_guesses, opener="raise", max_gue
         if verbose:
             print(f"  Guess {turn}: {guess} → {feedback_to_str(feedback)} (candidates: {len(candidates)})")
 
-        for ch in guess:
-            tested_letters.add(ch)
+        tested_mask |= letter_mask(guess)
 
-        if feedback == (2, 2, 2, 2, 2):
+        if feedback == ALL_GREEN:
             return turn, guesses, True
 
         candidates = filter_candidates(candidates, guess, feedback)
@@ -165,19 +148,29 @@ if __name__ == "__main__":
     import time
     answers = load_answers()
     all_guesses = load_all_guesses()
+    precompute_feedback(answers, answers)
 
     print("Running improved human heuristic simulation...")
     print(f"Answer pool: {len(answers)} words\n")
 
     results = []
     failures = []
+
+    def play(target):
+        # Reads the module-level lists the forked workers inherited; binding
+        # them into a partial would pickle a copy that misses the matrix
+        # fast path.
+        return play_game_improved(target, answers, all_guesses)
+
+    # One process per CPU plays a share of the targets, and games come back
+    # in target order.
     start = time.time()
 
-    for i, target in enumerate(answers):
+    games = fork_map(play, answers)
+    for i, (target, (n, guesses, solved)) in enumerate(zip(answers, games)):
         if (i + 1) % 500 == 0:
             elapsed = time.time() - start
             print(f"  {i+1}/{len(answers)} ({elapsed:.1f}s)")
-        n, guesses, solved = play_game_improved(target, answers, all_guesses)
         results.append(n)
         if not solved:
             failures.append((target, guesses))
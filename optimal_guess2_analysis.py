@@ -5,33 +5,27 @@ Goal: Find a small set of memorizable second-guess words that cover
 most feedback patterns from RAISE, approximating optimal play.
 """
 
+import heapq
 from collections import Counter, defaultdict
 from analysis import (
     load_answers, load_all_guesses,
-    compute_feedback, feedback_to_str,
+    compute_feedback, feedback_to_digits, feedback_to_str,
     partition_by_feedback, filter_candidates,
-    expected_information, expected_remaining,
+    expected_information, expected_information_all, expected_remaining,
+    most_informative_guess, precompute_feedback,
 )
 
 
 def best_guess_by_info(candidates):
     if len(candidates) <= 2:
         return candidates[0]
-    candidate_set = set(candidates)
-    best_word = None
-    best_info = -1
-    best_is_candidate = False
-    for word in candidates:
-        info = expected_information(word, candidates)
-        is_cand = word in candidate_set
-        if info > best_info or (info == best_info and is_cand and not best_is_candidate):
-            best_info = info
-            best_word = word
-            best_is_candidate = is_cand
-    return best_word
+    # Every guess is a candidate, so the candidate tiebreak never fires and
+    # the first guess with the highest info wins.
+    return most_informative_guess(candidates, candidates)
 
 
 answers = load_answers()
+precompute_feedback(answers, answers)
 OPENER = "raise"
 
 # Partition by RAISE feedback
@@ -57,7 +51,7 @@ print("-" * 60)
 for fb, candidates in sorted_buckets:
     g2, info, exp_rem = optimal_guess2[fb]
     fb_str = feedback_to_str(fb)
-    codes = "".join(str(x) for x in fb)
+    codes = feedback_to_digits(fb)
     print(f"  {fb_str} {codes:<8} {len(candidates):>4}   {g2 or '-':<10} {info:>6.3f} {exp_rem:>7.1f}")
 
 # Now analyze: how many distinct second-guess words does the optimal use?
@@ -94,7 +88,7 @@ for fb, cands in big_buckets:
     g2, info, exp_rem = optimal_guess2[fb]
     big_bucket_words[fb] = g2
     fb_str = feedback_to_str(fb)
-    codes = "".join(str(x) for x in fb)
+    codes = feedback_to_digits(fb)
     print(f"  {fb_str} ({codes}): {len(cands):>3} cands → {g2}")
 
 # How many distinct words for big buckets?
@@ -111,11 +105,10 @@ print(f"{'='*60}")
 print("\nTop 5 words per big bucket:")
 for fb, cands in big_buckets:
     fb_str = feedback_to_str(fb)
-    top = []
-    for word in cands:
-        info = expected_information(word, cands)
-        top.append((word, info))
-    top.sort(key=lambda x: -x[1])
+    # One batched scoring pass per bucket; only the 5 best need ordering
+    # (nlargest keeps ties in bucket order, like the stable sort did).
+    top = heapq.nlargest(5, zip(cands, expected_information_all(cands, cands)),
+                         key=lambda x: x[1])
     optimal_word = big_bucket_words[fb]
-    top_words = [f"{w}({i:.2f})" for w, i in top[:5]]
+    top_words = [f"{w}({i:.2f})" for w, i in top]
     print(f"  {fb_str} [{len(cands):>3}]: {', '.join(top_words)}  [optimal: {optimal_word}]")
@@ -10,11 +10,13 @@ import time
 from collections import Counter
 from analysis import (
     load_answers, load_all_guesses,
-    compute_feedback, feedback_to_str,
+    ALL_GREEN, compute_feedback, feedback_to_str,
     filter_candidates, partition_by_feedback,
-    expected_information, expected_remaining,
-    letter_frequency, positional_letter_frequency,
-    score_word_by_frequency, score_word_positional
+    bucket_sizes_all, expected_information_all, expected_remaining,
+    most_informative_guess,
+    letter_frequency, cached_positional_shares,
+    score_word_by_frequency, score_word_positional, precompute_feedback,
+    LETTER_BITS, letter_mask, word_letter_mask,
 )
 
 
@@ -27,16 +29,19 @@ def best_guess_by_info(candidates, valid_guesses=None):
     """
     if len(candidates) <= 2:
         return candidates[0]
+    if not valid_guesses:
+        # Every guess is a candidate, so the first best word wins, and a
+        # guess splitting the candidates into singletons ends the search.
+        return most_informative_guess(candidates, candidates)
 
-    pool = valid_guesses if valid_guesses else candidates
+    pool = valid_guesses
     candidate_set = set(candidates)
 
     best_word = None
     best_info = -1
     best_is_candidate = False
 
-    for word in pool:
-        info = expected_information(word, candidates)
+    for word, info in zip(pool, expected_information_all(pool, candidates)):
         is_cand = word in candidate_set
         # Prefer candidate words at equal info (they could be the answer)
         if info > best_info or (info == best_info and is_cand and not best_is_candidate):
@@ -52,7 +57,24 @@ def best_guess_by_expected_remaining(candidates, valid_guesses=None):
     if len(candidates) <= 2:
         return candidates[0]
 
-    pool = valid_guesses if valid_guesses else candidates
+    if not valid_guesses:
+        # Every guess is a candidate, so an equal score goes to the later
+        # word. Scanning from the end, the first minimum is that word, and
+        # 1.0 (all singletons) is the floor: nothing after it can win.
+        n = len(candidates)
+        pool = candidates[::-1]
+        best_word = None
+        best_rem = float('inf')
+        for word, sizes in zip(pool, bucket_sizes_all(pool, candidates)):
+            rem = sum(size * size for size in sizes) / n
+            if rem < best_rem:
+                best_rem = rem
+                best_word = word
+                if rem == 1.0:
+                    break
+        return best_word
+
+    pool = valid_guesses
     candidate_set = set(candidates)
 
     best_word = None
@@ -76,7 +98,8 @@ def best_guess_by_expected_remaining(candidates, valid_guesses=None):
 
 LETTER_PRIORITY = list("earotilsnucyhdpgmbfkwvxzqj")
 
-def human_heuristic_guess(candidates, all_guesses, tested_letters, green_known, yellow_known):
+
+def human_heuristic_guess(candidates, all_guesses, tested_mask):
     """
     Human-simulable heuristic for picking a guess.
 
@@ -88,46 +111,37 @@ def human_heuristic_guess(candidates, all_guesses, tested_letters, green_known,
     if len(candidates) <= 2:
         return candidates[0]
 
-    # Determine untested letters in priority order
-    untested_priority = [ch for ch in LETTER_PRIORITY if ch not in tested_letters]
+    # Determine untested letters in priority order; each scores its rank
+    # counted from the back of that list, keyed by the letter's mask bit
+    untested_priority = [ch for ch in LETTER_PRIORITY if not tested_mask & LETTER_BITS[ch]]
+    untested_rank = {LETTER_BITS[ch]: len(untested_priority) - idx
+                     for idx, ch in enumerate(untested_priority)}
+    untested_mask = sum(untested_rank)
 
     # Score each candidate
-    n = len(candidates)
-    pos_freq = positional_letter_frequency(candidates)
-
-    best_word = None
-    best_score = -1
+    pos_shares = cached_positional_shares(tuple(candidates))
 
-    for word in candidates:  # In hard mode, guess from candidates
-        # Count untested high-priority letters (weighted by priority position)
+    def score(word):
+        # Count untested high-priority letters (weighted by priority position),
+        # each distinct letter once: walk the word's untested bits
         untested_score = 0
-        seen = set()
-        for ch in word:
-            if ch in seen:
-                continue
-            seen.add(ch)
-            if ch in tested_letters:
-                continue
+        new_letters = word_letter_mask(word) & untested_mask
+        while new_letters:
+            bit = new_letters & -new_letters
             # Higher priority = lower index = higher score
-            try:
-                idx = untested_priority.index(ch)
-                untested_score += (len(untested_priority) - idx)
-            except ValueError:
-                pass
+            untested_score += untested_rank[bit]
+            new_letters ^= bit
 
         # Add positional frequency bonus
         pos_score = 0
-        for i, ch in enumerate(word):
-            pos_score += pos_freq[i].get(ch, 0) / n
+        for share, ch in zip(pos_shares, word):
+            pos_score += share[ch]
 
         # Combined score: untested coverage is primary, positional is tiebreaker
-        score = untested_score * 100 + pos_score
+        return untested_score * 100 + pos_score
 
-        if score > best_score:
-            best_score = score
-            best_word = word
-
-    return best_word
+    # In hard mode, guess from candidates; max() keeps the first best word
+    return max(candidates, key=score)
 
 
 def play_game(target, strategy, all_answers, all_guesses, opener="raise", max_guesses=6, verbose=False):
@@ -136,11 +150,9 @@ def play_game(target, strategy, all_answers, all_guesses, opener="raise", max_gu
 
     Returns: (n_guesses, guesses_list, solved)
     """
-    candidates = list(all_answers)
+    candidates = all_answers  # never mutated; filtering builds new lists
     guesses = []
-    tested_letters = set()
-    green_known = [None] * 5
-    yellow_known = [set() for _ in range(5)]  # yellow_known[i] = letters known to NOT be at position i
+    tested_mask = 0  # letter_mask of every letter guessed so far
 
     for turn in range(1, max_guesses + 1):
         if turn == 1:
@@ -152,10 +164,7 @@ def play_game(target, strategy, all_answers, all_guesses, opener="raise", max_gu
             elif strategy == "expected_remaining":
                 guess = best_guess_by_expected_remaining(candidates)
             elif strategy == "human":
-                guess = human_heuristic_guess(
-                    candidates, all_guesses, tested_letters,
-                    green_known, yellow_known
-                )
+                guess = human_heuristic_guess(candidates, all_guesses, tested_mask)
             else:
                 raise ValueError(f"Unknown strategy: {strategy}")
 
@@ -166,17 +175,9 @@ def play_game(target, strategy, all_answers, all_guesses, opener="raise", max_gu
             print(f"  Guess {turn}: {guess} → {feedback_to_str(feedback)}")
 
         # Update tested letters
-        for ch in guess:
-            tested_letters.add(ch)
-
-        # Update green/yellow knowledge
-        for i, (ch, fb) in enumerate(zip(guess, feedback)):
-            if fb == 2:
-                green_known[i] = ch
-            elif fb == 1:
-                yellow_known[i].add(ch)
+        tested_mask |= letter_mask(guess)
 
-        if feedback == (2, 2, 2, 2, 2):
+        if feedback == ALL_GREEN:
             return turn, guesses, True
 
         # Filter candidates
@@ -237,6 +238,9 @@ def run_simulation(strategy, answers, all_guesses, opener="raise", max_guesses=6
 if __name__ == "__main__":
     answers = load_answers()
     all_guesses = load_all_guesses()
+    # Every guess and candidate is an answer word (the opener too, normally),
+    # so all feedback comes from the answers x answers matrix.
+    precompute_feedback(answers, answers)
 
     strategy = sys.argv[1] if len(sys.argv) > 1 else "human"
     opener = sys.argv[2] if len(sys.argv) > 2 else "raise"
@@ -11,10 +11,11 @@ import time
 from collections import Counter, defaultdict
 from analysis import (
     load_answers, load_all_guesses,
-    compute_feedback, feedback_to_str,
+    ALL_GREEN, compute_feedback, feedback_slots, feedback_to_str,
     partition_by_feedback, filter_candidates,
-    expected_information, expected_remaining,
-    letter_frequency, positional_letter_frequency,
+    expected_remaining, most_informative_guess, best_info_guess,
+    letter_columns, letter_frequency, cached_positional_shares, precompute_feedback, fork_map,
+    LETTER_BITS, letter_mask, word_letter_mask,
 )
 
 
@@ -29,14 +30,7 @@ def build_guess2_table(answers, opener="raise"):
             table[fb] = candidates[0] if candidates else None
             continue
         # Find best guess from candidates (hard mode: guess must be a candidate)
-        best_word = None
-        best_info = -1
-        for word in candidates:
-            info = expected_information(word, candidates)
-            if info > best_info:
-                best_info = info
-                best_word = word
-        table[fb] = best_word
+        table[fb] = most_informative_guess(candidates, candidates)
     return table
 
 
@@ -45,7 +39,7 @@ def build_guess2_table(answers, opener="raise"):
 LETTER_PRIORITY = list("earotilsnucyhdpgmbfkwvxzqj")
 
 
-def improved_guess(candidates, tested_letters):
+def improved_guess(candidates, tested_mask):
     """Smart heuristic for guesses 3+.
 
     Key improvements:
@@ -58,17 +52,15 @@ def improved_guess(candidates, tested_letters):
 
     # Detect: do candidates mostly differ in one position?
     varying = {}
-    for pos in range(5):
-        letters = set(w[pos] for w in candidates)
+    for pos, column in enumerate(letter_columns(candidates)):
+        letters = set(column)
         if len(letters) > 1:
             varying[pos] = letters
 
     # If only 1-2 positions vary and we have many candidates,
     # score by how many varying-position letters the word covers
     if len(varying) <= 2 and len(candidates) >= 4:
-        best_word = None
-        best_score = -1
-        for word in candidates:
+        def trap_score(word):
             score = 0
             for pos, letters in varying.items():
                 # How many of the ambiguous letters does this word "test"?
@@ -80,69 +72,52 @@ def improved_guess(candidates, tested_letters):
                 for ch in set(word):
                     if ch in letters:
                         score += 0.3
-            if score > best_score:
-                best_score = score
-                best_word = word
-        return best_word
+            return score
+
+        return max(candidates, key=trap_score)  # first best word wins ties
 
     # General case: maximize info via expected_information if small enough
     if len(candidates) <= 20:
-        best_word = None
-        best_info = -1
-        for word in candidates:
-            info = expected_information(word, candidates)
-            if info > best_info:
-                best_info = info
-                best_word = word
-        return best_word
+        return best_info_guess(tuple(candidates))
 
     # Large candidate pool: use letter-priority heuristic
-    untested_priority = [ch for ch in LETTER_PRIORITY if ch not in tested_letters]
-    pos_freq = positional_letter_frequency(candidates)
-    n = len(candidates)
+    untested_priority = [ch for ch in LETTER_PRIORITY if not tested_mask & LETTER_BITS[ch]]
+    untested_rank = {LETTER_BITS[ch]: len(untested_priority) - idx
+                     for idx, ch in enumerate(untested_priority)}
+    untested_mask = sum(untested_rank)
+    pos_shares = cached_positional_shares(tuple(candidates))
 
-    best_word = None
-    best_score = -1.0
-    for word in candidates:
+    def score(word):
         untested_score = 0
-        seen = set()
-        for ch in word:
-            if ch in seen:
-                continue
-            seen.add(ch)
-            if ch not in tested_letters:
-                try:
-                    idx = untested_priority.index(ch)
-                    untested_score += (len(untested_priority) - idx)
-                except ValueError:
-                    pass
-        pos_score = sum(pos_freq[i].get(ch, 0) / n for i, ch in enumerate(word))
-        score = untested_score * 100 + pos_score
-        if score > best_score:
-            best_score = score
-            best_word = word
-
-    return best_word
+        new_letters = word_letter_mask(word) & untested_mask  # distinct, untested
+        while new_letters:
+            bit = new_letters & -new_letters
+            untested_score += untested_rank[bit]
+            new_letters ^= bit
+        pos_score = sum(share[ch] for share, ch in zip(pos_shares, word))
+        return untested_score * 100 + pos_score
+
+    return max(candidates, key=score)  # first best word wins ties
 
 
 def play_game_v2(target, answers, all_guesses, guess2_table, opener="raise", max_guesses=6, verbose=False):
     """Play hard-mode Wordle with the V2 strategy."""
-    candidates = list(answers)
+    candidates = answers  # never mutated; filtering builds new lists
     guesses = []
-    tested_letters = set()
+    tested_mask = 0  # letter_mask of every letter guessed so far
 
     for turn in range(1, max_guesses + 1):
         if turn == 1:
             guess = opener
         elif turn == 2:
-            # Use lookup table
+            # Use lookup table (a feedback_slots list, indexed by code)
             prev_fb = guesses[-1][1]
-            guess = guess2_table.get(prev_fb)
+            guess = guess2_table[prev_fb]
             if guess is None or guess not in candidates:
                 # Fallback to heuristic
-                guess = improved_guess(candidates, tested_letters)
+                guess = improved_guess(candidates, tested_mask)
         else:
-            guess = improved_guess(candidates, tested_letters)
+            guess = improved_guess(candidates, tested_mask)
 
         feedback = compute_feedback(guess, target)
         guesses.append((guess, feedback))
@@ -151,10 +126,9 @@ def play_game_v2(target, answers, all_guesses, guess2_table, opener="raise", max
             n_cands = len(candidates)
             print(f"  G{turn}: {guess} → {feedback_to_str(feedback)} ({n_cands} candidates)")
 
-        for ch in guess:
-            tested_letters.add(ch)
+        tested_mask |= letter_mask(guess)
 
-        if feedback == (2, 2, 2, 2, 2):
+        if feedback == ALL_GREEN:
             return turn, guesses, True
 
         candidates = filter_candidates(candidates, guess, feedback)
@@ -164,15 +138,31 @@ def play_game_v2(target, answers, all_guesses, guess2_table, opener="raise", max
     return max_guesses, guesses, False
 
 
+# (answers, all_guesses, guess2_slots, opener) for the games run_simulation
+# is playing. Set before the pool forks, so workers read the lists they
+# inherited instead of a pickled copy that misses the matrix fast path.
+_game_args = None
+
+
+def play(target):
+    """play_game_v2 for one target with the current run_simulation setup."""
+    return play_game_v2(target, *_game_args)
+
+
 def run_simulation(answers, all_guesses, guess2_table, opener="raise"):
+    global _game_args
+
     results = []
     failures = []
+    _game_args = (answers, all_guesses, feedback_slots(guess2_table), opener)
+    # Games are independent, so targets are split across one process per
+    # CPU; results come back in target order.
     start = time.time()
 
-    for i, target in enumerate(answers):
+    games = fork_map(play, answers)
+    for i, (target, (n, guesses, solved)) in enumerate(zip(answers, games)):
         if (i + 1) % 500 == 0:
             print(f"  {i+1}/{len(answers)} ({time.time()-start:.1f}s)")
-        n, guesses, solved = play_game_v2(target, answers, all_guesses, guess2_table, opener)
         results.append(n)
         if not solved:
             failures.append((target, guesses))
@@ -203,6 +193,7 @@ def run_simulation(answers, all_guesses, guess2_table, opener="raise"):
 if __name__ == "__main__":
     answers = load_answers()
     all_guesses = load_all_guesses()
+    precompute_feedback(answers, answers)
 
     print("Building optimal guess-2 lookup table for RAISE...")
     table = build_guess2_table(answers)
@@ -219,18 +210,31 @@ if __name__ == "__main__":
     buckets = partition_by_feedback("raise", answers)
     sorted_patterns = sorted(buckets.keys(), key=lambda fb: -len(buckets[fb]))
 
+    # A partial table only changes turn 2, and only through whether the
+    # target's RAISE pattern is memorized: if it is, the game is the one
+    # already played with the full table; if not, it is the heuristic
+    # fallback game, whichever size the table is. So each target needs at
+    # most one extra game across all table sizes.
+    raise_pattern = {target: fb for fb, targets in buckets.items() for target in targets}
+    failed_targets = {target for target, _ in failures}
+    full_games = {target: (n, target not in failed_targets)
+                  for target, n in zip(answers, results)}
+    no_table = feedback_slots({})
+    fallback_games = {}
+
     for n_memorized in [5, 10, 15, 20, 37]:
-        # Build a partial table with only the top N patterns
-        partial_table = {}
-        for fb in sorted_patterns[:n_memorized]:
-            partial_table[fb] = table[fb]
+        memorized = set(sorted_patterns[:n_memorized])
 
         results2 = []
         failures2 = []
         for target in answers:
-            n, guesses, solved = play_game_v2(
-                target, answers, all_guesses, partial_table
-            )
+            if raise_pattern[target] in memorized:
+                n, solved = full_games[target]
+            else:
+                if target not in fallback_games:
+                    n, _, solved = play_game_v2(target, answers, all_guesses, no_table)
+                    fallback_games[target] = (n, solved)
+                n, solved = fallback_games[target]
             results2.append(n)
             if not solved:
                 failures2.append(target)
@@ -0,0 +1,23 @@
+import unittest
+
+from analysis import fork_map, load_answers, precompute_feedback, rank_opening_words
+
+
+class ForkMapTest(unittest.TestCase):
+    def test_pooled_results_match_map_in_order(self):
+        xs = list(range(50))
+        ys = list(range(50, 100))
+        self.assertEqual(list(fork_map(pow, xs, ys, workers=3)), list(map(pow, xs, ys)))
+
+
+class RankOpeningWordsTest(unittest.TestCase):
+    def test_pooled_ranking_matches_serial(self):
+        answers = load_answers()[:400]
+        precompute_feedback(answers, answers, cache_dir=None)
+        serial = rank_opening_words(answers, top_n=25, workers=1)
+        pooled = rank_opening_words(answers, top_n=25, workers=2)
+        self.assertEqual(pooled, serial)
+
+
+if __name__ == "__main__":
+    unittest.main()